@@ -0,0 +1,64 @@
+# Copyright (c) 2016 Tim Savannah under terms of the Lesser GNU Public License Version 2.1 (LGPLv2.1).
+#
+#  Tests for range string parsing - the string-op fast path, the regex
+#    fallback, and the error contract
+
+import pytest
+
+import weektime
+from weektime import WeekRange, WeekRanges, WeekRangeValueError
+
+
+@pytest.mark.parametrize('rangeStr, expected', [
+    ('Mon 09:00 - Fri 18:00', 'Mon 09:00 - Fri 18:00'),
+    ('Mon  9:00  -  Fri 18:00', 'Mon 09:00 - Fri 18:00'),
+    ('  Mon 9:00 - 18:30 ', 'Mon 09:00 - Mon 18:30'),   # day on one side applies to both
+    ('9:00-17:00', '09:00 - 17:00'),
+    ('9:0-17:5', '09:00 - 17:05'),
+    ('Mon 9 : 00 - Fri 17 : 30', 'Mon 09:00 - Fri 17:30'),  # regex-fallback shape
+    ('sun 0:00 - SAT 23:59', 'Sun 00:00 - Sat 23:59'),
+])
+def test_accepted_forms(rangeStr, expected):
+    assert str(WeekRange.createFromStr(rangeStr)) == expected
+
+
+@pytest.mark.parametrize('rangeStr', [
+    '',
+    'garbage',
+    'Mon 9:00',                     # no end side
+    'Monday 9:00 - 17:00',          # day must be exactly three letters
+    'Mon xx:00 - 17:00',
+    'Mon 9:00 - 17:0x',
+    'Mon 999:00 - 17:00',
+    'Xyz 9:00 - 17:00',             # not a day
+    'Mon 24:00 - Fri 18:00',        # out of range
+    'Mon 9:60 - Fri 18:00',
+    '²:00 - 17:00',            # superscript two: digit but not decimal
+    '٩:00 - 17:00',            # arabic-indic nine: decimal but not ASCII
+    'Mon\t09:00 - Fri 18:00',       # only spaces pad tokens
+    '9:00\n- 17:00',
+    'Mon 09:00 -\tFri 18:00',
+])
+def test_rejected_forms_raise_weekrangevalueerror(rangeStr):
+    with pytest.raises(WeekRangeValueError):
+        WeekRange.createFromStr(rangeStr)
+
+
+def test_fast_path_agrees_with_regex():
+    # Everything the fast path accepts, the regex must accept identically
+    for rangeStr in ['Mon 09:00 - Fri 18:00', '9:00-17:00', 'Sat 10:00 - 14:00']:
+        matchObj = weektime.WEEK_RANGE_RE.match(rangeStr)
+        assert matchObj is not None
+        groupDict = matchObj.groupdict()
+        fastParsed = weektime._parseRangeStrFast(rangeStr)
+        assert fastParsed == (groupDict['startDay'], groupDict['startHour'], groupDict['startMinute'], \
+            groupDict['endDay'], groupDict['endHour'], groupDict['endMinute'])
+
+
+def test_weekranges_create_from_str():
+    weekRanges = WeekRanges.createFromStr('Mon 09:00 - Fri 18:00, Sat 10:00 - 14:00')
+    assert len(weekRanges) == 2
+    assert str(weekRanges[0]) == 'Mon 09:00 - Fri 18:00'
+    assert str(weekRanges[1]) == 'Sat 10:00 - Sat 14:00'
+    with pytest.raises(WeekRangeValueError):
+        WeekRanges.createFromStr('Mon 09:00 - Fri 18:00, nope')
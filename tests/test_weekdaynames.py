@@ -0,0 +1,39 @@
+# Copyright (c) 2016 Tim Savannah under terms of the Lesser GNU Public License Version 2.1 (LGPLv2.1).
+#
+#  Tests locking the weekday table ordering - Sunday first, matching what
+#    strftime produces for actual dates in the active locale
+
+import datetime
+
+from weektime import getWeekDayNames, getWeekDayAbbreviations, dayStrToNumber
+
+
+# A known Sunday
+SUNDAY = datetime.datetime(2026, 8, 30)
+
+
+def test_names_ordered_sunday_first():
+    names = getWeekDayNames()
+    abbreviations = getWeekDayNames(abbreviated=True)
+    assert len(names) == 7 and len(abbreviations) == 7
+    for dayNum in range(7):
+        day = SUNDAY + datetime.timedelta(days=dayNum)
+        assert names[dayNum] == day.strftime('%A')
+        assert abbreviations[dayNum] == day.strftime('%a')
+
+
+def test_abbreviations_and_lowering():
+    abbreviations = getWeekDayAbbreviations()
+    lowered = getWeekDayAbbreviations(lower=True)
+    assert lowered == [ dayName.lower() for dayName in abbreviations ]
+    # Returned lists are fresh copies
+    abbreviations.append('zzz')
+    assert len(getWeekDayAbbreviations()) == 7
+
+
+def test_day_str_to_number_round_trip():
+    abbreviations = getWeekDayAbbreviations()
+    for dayNum in range(7):
+        assert dayStrToNumber(abbreviations[dayNum]) == dayNum
+        assert dayStrToNumber(abbreviations[dayNum].upper()) == dayNum
+        assert dayStrToNumber(abbreviations[dayNum].lower()) == dayNum
@@ -0,0 +1,147 @@
+# Copyright (c) 2016 Tim Savannah under terms of the Lesser GNU Public License Version 2.1 (LGPLv2.1).
+#
+#  Tests for WeekRange - construction, intersect semantics, immutability,
+#    interning, and copy/pickle support
+
+import copy
+import datetime
+import pickle
+import signal
+
+import pytest
+
+import weektime
+from weektime import WeekRange, WeekRangeValueError
+
+
+# A known Sunday, used to walk every day of one week
+SUNDAY = datetime.datetime(2026, 8, 30)
+
+
+def referenceIntersects(startDay, startHour, startMinute, endDay, endHour, endMinute, datetimeObj):
+    '''
+        referenceIntersects - The pre-rewrite intersect semantics ( the nine
+          branchy methods ), restated directly in terms of keys. The one known,
+          deliberate divergence - time-only same-hour ranges with start after
+          end, which never wrapped - is covered by its own test below and
+          excluded from the parity sweep.
+    '''
+    day = (datetimeObj.weekday() + 1) % 7
+    if startDay is None:
+        key = datetimeObj.hour * 60 + datetimeObj.minute
+        startKey = startHour * 60 + startMinute
+        endKey = endHour * 60 + endMinute
+    else:
+        key = day * 1440 + datetimeObj.hour * 60 + datetimeObj.minute
+        startKey = startDay * 1440 + startHour * 60 + startMinute
+        endKey = endDay * 1440 + endHour * 60 + endMinute
+
+    if startKey <= endKey:
+        return startKey <= key < endKey
+    return key >= startKey or key < endKey
+
+
+def test_multiday_intersects_does_not_stall():
+    # A leftover debug breakpoint once stalled this path forever; make sure a
+    #   multi-day inner range answers promptly
+    def onAlarm(signum, frame):
+        raise AssertionError('intersects stalled')
+
+    weekRange = WeekRange.createFromStr('Mon 09:00 - Fri 18:00')
+    if hasattr(signal, 'SIGALRM'):
+        oldHandler = signal.signal(signal.SIGALRM, onAlarm)
+        signal.alarm(10)
+        try:
+            weekRange.intersects(datetime.datetime.now())
+        finally:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, oldHandler)
+    else:
+        weekRange.intersects(datetime.datetime.now())
+
+
+@pytest.mark.parametrize('rangeArgs', [
+    (1, 9, 0, 5, 18, 0),      # forward multi-day
+    (5, 18, 0, 1, 9, 0),      # wraps the week boundary
+    (2, 9, 0, 2, 12, 30),     # same day, forward
+    (2, 18, 0, 2, 9, 0),      # same day, wraps
+    (3, 10, 15, 3, 10, 45),   # same day same hour, forward
+    (3, 10, 45, 3, 10, 15),   # same day same hour, wraps
+    (2, 9, 0, 2, 9, 0),       # empty
+    (0, 0, 0, 6, 23, 59),     # nearly the whole week
+    (None, 9, 0, None, 18, 0),    # time-only forward
+    (None, 18, 0, None, 9, 0),    # time-only wraps
+    (None, 10, 15, None, 10, 45), # time-only same hour, forward
+    (None, 12, 30, None, 12, 30), # time-only empty
+])
+def test_intersects_parity_with_original(rangeArgs):
+    weekRange = WeekRange(*rangeArgs)
+    for minuteOfWeek in range(0, 7 * 1440, 11):
+        datetimeObj = SUNDAY + datetime.timedelta(minutes=minuteOfWeek)
+        assert weekRange.intersects(datetimeObj) == referenceIntersects(*rangeArgs, datetimeObj), \
+            '%s vs reference at %s' % (str(weekRange), str(datetimeObj))
+
+
+def test_time_only_same_hour_wraps():
+    # Deliberate change from older releases: "10:45 - 10:15" wraps like every
+    #   other start-after-end range instead of matching nothing
+    weekRange = WeekRange.createFromStr('10:45 - 10:15')
+    assert weekRange.intersects(datetime.datetime(2026, 9, 2, 10, 30)) is False
+    assert weekRange.intersects(datetime.datetime(2026, 9, 2, 10, 15)) is False
+    assert weekRange.intersects(datetime.datetime(2026, 9, 2, 10, 14)) is True
+    assert weekRange.intersects(datetime.datetime(2026, 9, 2, 10, 45)) is True
+    assert weekRange.intersects(datetime.datetime(2026, 9, 2, 12, 0)) is True
+    # The day-qualified analog behaves the same way on its day
+    dayRange = WeekRange.createFromStr('Wed 10:45 - Wed 10:15')
+    assert dayRange.intersects(datetime.datetime(2026, 9, 2, 10, 30)) is False
+    assert dayRange.intersects(datetime.datetime(2026, 9, 2, 12, 0)) is True
+
+
+def test_endpoints_inclusive_start_exclusive_end():
+    weekRange = WeekRange.createFromStr('Mon 09:00 - Fri 18:00')
+    assert weekRange.intersects(datetime.datetime(2026, 8, 31, 9, 0)) is True
+    assert weekRange.intersects(datetime.datetime(2026, 8, 31, 8, 59)) is False
+    assert weekRange.intersects(datetime.datetime(2026, 9, 4, 17, 59)) is True
+    assert weekRange.intersects(datetime.datetime(2026, 9, 4, 18, 0)) is False
+
+
+def test_str_and_repr():
+    weekRange = WeekRange.createFromStr('Mon 9:05 - Fri 18:00')
+    assert str(weekRange) == 'Mon 09:05 - Fri 18:00'
+    # Cached second call
+    assert str(weekRange) == 'Mon 09:05 - Fri 18:00'
+    assert str(WeekRange.createFromStr('9:00-17:5')) == '09:00 - 17:05'
+    assert repr(weekRange) == 'WeekRange( 1, 9, 5, 5, 18, 0 )'
+
+
+def test_validation_errors():
+    for badArgs in [
+        (1, 24, 0, 5, 18, 0),
+        (1, 9, 60, 5, 18, 0),
+        (1, 9, 0, 7, 18, 0),
+        (1, 9, 0, None, 18, 0),  # only one day given
+    ]:
+        with pytest.raises(WeekRangeValueError):
+            WeekRange(*badArgs)
+
+
+def test_immutable():
+    weekRange = WeekRange.createFromStr('Mon 09:00 - Fri 18:00')
+    with pytest.raises(AttributeError):
+        weekRange.startHour = 5
+    with pytest.raises(AttributeError):
+        weekRange._frozen = False
+
+
+def test_interning_and_create_cache():
+    assert WeekRange(1, 9, 0, 5, 18, 0) is WeekRange(1, 9, 0, 5, 18, 0)
+    assert WeekRange.createFromStr('Mon 09:00 - Fri 18:00') is WeekRange.createFromStr(' Mon 09:00 - Fri 18:00 ')
+    assert WeekRange(None, 9, 0, None, 18, 0) is not WeekRange(1, 9, 0, 5, 18, 0)
+
+
+def test_copy_and_pickle():
+    weekRange = WeekRange.createFromStr('Mon 09:00 - Fri 18:00')
+    assert copy.copy(weekRange) is weekRange
+    assert copy.deepcopy(weekRange) is weekRange
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(weekRange, protocol=protocol)) is weekRange
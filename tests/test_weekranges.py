@@ -0,0 +1,120 @@
+# Copyright (c) 2016 Tim Savannah under terms of the Lesser GNU Public License Version 2.1 (LGPLv2.1).
+#
+#  Tests for WeekRanges - the indexed scalar scan ( compiled and pure-python ),
+#    index invalidation across every mutator, copy/pickle, and the batch path
+
+import copy
+import datetime
+import pickle
+import random
+
+import pytest
+
+import weektime
+from weektime import WeekRange, WeekRanges
+
+
+RANGES_STR = 'Mon 09:00 - Fri 18:00, Sat 10:00 - 14:00, 23:30 - 0:15, Fri 22:00 - Mon 3:00'
+
+
+def makeDatetimes(count, seed):
+    rand = random.Random(seed)
+    return [ datetime.datetime(2026, rand.randint(1, 12), rand.randint(1, 28), rand.randint(0, 23), rand.randint(0, 59)) \
+        for _unused in range(count) ]
+
+
+def assertMatchesPerRange(weekRanges, datetimes):
+    for datetimeObj in datetimes:
+        expected = any(weekRange.intersects(datetimeObj) for weekRange in weekRanges)
+        assert weekRanges.intersects(datetimeObj) == expected, \
+            '%s vs per-range at %s' % (repr(list(map(str, weekRanges))), str(datetimeObj))
+
+
+@pytest.fixture(params=['kernel', 'python'])
+def scanPath(request, monkeypatch):
+    '''
+        scanPath - Run the test under both the compiled kernel ( when numba is
+          installed ) and the pure-python bucket scan
+    '''
+    if request.param == 'python':
+        monkeypatch.setitem(weektime._getFindMatchKernel.__globals__, '__findMatchKernel', False)
+    else:
+        pytest.importorskip('numba')
+    return request.param
+
+
+def test_intersects_matches_per_range(scanPath):
+    weekRanges = WeekRanges.createFromStr(RANGES_STR)
+    assertMatchesPerRange(weekRanges, makeDatetimes(400, seed=1))
+
+
+def test_same_length_setitem_invalidates(scanPath):
+    weekRanges = WeekRanges.createFromStr('Mon 09:00 - Fri 18:00, Sat 10:00 - 14:00')
+    assert weekRanges.intersects(datetime.datetime(2026, 9, 2, 12, 0)) is True
+    weekRanges[0] = WeekRange.createFromStr('Sun 01:00 - 02:00')
+    assert weekRanges.intersects(datetime.datetime(2026, 9, 2, 12, 0)) is False
+    assert weekRanges.intersects(datetime.datetime(2026, 8, 30, 1, 30)) is True
+
+
+def test_remove_then_append_invalidates(scanPath):
+    weekRanges = WeekRanges.createFromStr('Mon 09:00 - Fri 18:00')
+    monday = datetime.datetime(2026, 8, 31, 11, 0)
+    assert weekRanges.intersects(monday) is True
+    weekRanges.remove(weekRanges[0])
+    weekRanges.append(WeekRange.createFromStr('Sat 10:00 - 14:00'))
+    assert weekRanges.intersects(monday) is False
+    assert weekRanges.intersects(datetime.datetime(2026, 9, 5, 11, 0)) is True
+
+
+def test_every_mutator_invalidates(scanPath):
+    datetimes = makeDatetimes(200, seed=2)
+    weekRanges = WeekRanges.createFromStr(RANGES_STR)
+    assertMatchesPerRange(weekRanges, datetimes)
+
+    weekRanges.pop()
+    assertMatchesPerRange(weekRanges, datetimes)
+    weekRanges.insert(0, WeekRange.createFromStr('Wed 2:00 - 3:00'))
+    assertMatchesPerRange(weekRanges, datetimes)
+    del weekRanges[1]
+    assertMatchesPerRange(weekRanges, datetimes)
+    weekRanges.reverse()
+    assertMatchesPerRange(weekRanges, datetimes)
+    weekRanges += [WeekRange.createFromStr('Sun 5:00 - 6:00')]
+    assertMatchesPerRange(weekRanges, datetimes)
+    weekRanges *= 2
+    assertMatchesPerRange(weekRanges, datetimes)
+    weekRanges.sort(key=str)
+    assertMatchesPerRange(weekRanges, datetimes)
+    weekRanges.extend([WeekRange.createFromStr('Thu 7:00 - 8:00')])
+    assertMatchesPerRange(weekRanges, datetimes)
+
+    # Incremental append after a clean scan
+    weekRanges.intersects(datetimes[0])
+    weekRanges.append(WeekRange.createFromStr('Fri 20:00 - 21:00'))
+    assert weekRanges.intersects(datetime.datetime(2026, 9, 4, 20, 30)) is True
+    assertMatchesPerRange(weekRanges, datetimes)
+
+    weekRanges.clear()
+    assert weekRanges.intersects(datetimes[0]) is False
+
+
+def test_copy_and_pickle(scanPath):
+    weekRanges = WeekRanges.createFromStr(RANGES_STR)
+    datetimes = makeDatetimes(100, seed=3)
+    for restored in [ pickle.loads(pickle.dumps(weekRanges)), copy.copy(weekRanges), copy.deepcopy(weekRanges) ]:
+        assert list(restored) == list(weekRanges)
+        assertMatchesPerRange(restored, datetimes)
+
+
+def test_intersects_batch_matches_scalar():
+    numpy = pytest.importorskip('numpy')
+    import calendar as calendarModule
+
+    weekRanges = WeekRanges.createFromStr(RANGES_STR)
+    datetimes = makeDatetimes(1000, seed=4)
+    timestamps = numpy.array([ calendarModule.timegm(datetimeObj.timetuple()) for datetimeObj in datetimes ], dtype=numpy.int64)
+    expected = numpy.array([ any(weekRange.intersects(datetimeObj) for weekRange in weekRanges) for datetimeObj in datetimes ])
+
+    assert (weekRanges.intersectsBatch(timestamps) == expected).all()
+    assert (weekRanges.intersectsBatch(timestamps.astype('datetime64[s]')) == expected).all()
+    assert (weekRanges.intersectsBatch(timestamps.astype(float)) == expected).all()
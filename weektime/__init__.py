@@ -0,0 +1,715 @@
+# Copyright (c) 2016 Tim Savannah under terms of the Lesser GNU Public License Version 2.1 (LGPLv2.1).
+#  You should have received a copy of this as "LICENSE" with this distribution.
+#
+#  weektime - Module for dealing with weeks, and checking absolute dates
+#    relative to week-based ranges (like "Mon 09:00 - Thu 15:00")
+
+import array
+import calendar
+import functools
+import re
+import weakref
+
+__all__ = ('WeekRange', 'WeekRanges', 'WeekRangeValueError', 'getWeekDayNames', 'getWeekDayAbbreviations', 'dayStrToNumber', 'WEEK_RANGE_RE')
+
+__version__ = '1.0.0'
+__version_tuple__ = (1, 0, 0)
+
+
+# WEEK_RANGE_RE - Regular expression matching a single week range string,
+#   like "Mon 9:00 - Fri 17:00" or just "9:00 - 17:00" (applies every day)
+WEEK_RANGE_RE = re.compile(r'^ *(?P<startDay>[a-zA-Z]{3})? *(?P<startHour>\d{1,2}) *: *(?P<startMinute>\d{1,2}) *- *(?P<endDay>[a-zA-Z]{3})? *(?P<endHour>\d{1,2}) *: *(?P<endMinute>\d{1,2}) *$', re.ASCII)
+
+
+# _EPOCH_WEEK_MINUTE_OFFSET - Minute-of-week ( Sunday 00:00 = 0 ) of the POSIX
+#   epoch, 1970-01-01 00:00, which was a Thursday ( day 4 )
+_EPOCH_WEEK_MINUTE_OFFSET = 4 * 1440
+
+
+class WeekRangeValueError(ValueError):
+    '''
+        WeekRangeValueError - Raised when an invalid value is given for any
+          portion of a week range (day/hour/minute or an unparseable string)
+    '''
+    pass
+
+
+def _computeWeekDayTables():
+    '''
+        _computeWeekDayTables - Compute the weekday name tables for the current
+          locale, Sunday first. Run once at import; the module-level tables below
+          hold the results.
+
+        @return tuple( names tuple<str>, abbreviations tuple<str> )
+    '''
+    # calendar's prebuilt locale tables start with Monday; rotate so index 0
+    #   is Sunday, matching the day numbering used throughout this module
+    dayNums = (6, 0, 1, 2, 3, 4, 5)
+
+    names = tuple(calendar.day_name[dayNum] for dayNum in dayNums)
+    abbreviations = tuple(calendar.day_abbr[dayNum] for dayNum in dayNums)
+
+    return (names, abbreviations)
+
+
+# _WEEKDAY_NAMES / _WEEKDAY_ABBREVS - Day names and abbreviations for the locale
+#   active at import, Sunday first. _WEEKDAY_ABBREV_INDEX maps the lowercase
+#   abbreviation to the day number for parsing.
+(_WEEKDAY_NAMES, _WEEKDAY_ABBREVS) = _computeWeekDayTables()
+_WEEKDAY_ABBREVS_LOWER = tuple(dayName.lower() for dayName in _WEEKDAY_ABBREVS)
+_WEEKDAY_ABBREV_INDEX = { dayName : dayNum for dayNum, dayName in enumerate(_WEEKDAY_ABBREVS_LOWER) }
+
+
+def getWeekDayNames(abbreviated=False):
+    '''
+        getWeekDayNames - Get the names of the days of the week, in the current locale,
+          starting with Sunday.
+
+        @param abbreviated <bool> Default False - If True, return the abbreviated names
+          (like "Mon"), otherwise the full names (like "Monday")
+
+        @return list<str> - Names of the days of the week, Sunday first
+    '''
+    if abbreviated:
+        return list(_WEEKDAY_ABBREVS)
+    return list(_WEEKDAY_NAMES)
+
+
+def getWeekDayAbbreviations(lower=False):
+    '''
+        getWeekDayAbbreviations - Get the abbreviated names of the days of the week
+          (like "Mon"), in the current locale, starting with Sunday.
+
+        @param lower <bool> Default False - If True, the names are lowercased
+
+        @return list<str> - Abbreviated names of the days of the week, Sunday first.
+          A fresh list is returned each call, safe for the caller to modify.
+    '''
+    if lower is True:
+        return list(_WEEKDAY_ABBREVS_LOWER)
+    return list(_WEEKDAY_ABBREVS)
+
+
+def dayStrToNumber(dayStr):
+    '''
+        dayStrToNumber - Convert a day abbreviation (like "Mon"), case-insensitive,
+          to its number within the week, Sunday being 0.
+
+        @param dayStr <str> - A day abbreviation, like "Mon"
+
+        @return <int> - The number of that day within the week, Sunday=0 .. Saturday=6
+
+        @raises WeekRangeValueError - If #dayStr is not a valid day abbreviation
+    '''
+    dayNum = _WEEKDAY_ABBREV_INDEX.get(dayStr[:3].lower())
+    if dayNum is None:
+        raise WeekRangeValueError('Unknown day abbreviation: "%s"' % (dayStr,))
+    return dayNum
+
+
+# __findMatchKernel - Lazily-compiled numba kernel for scanning range keys,
+#   or False if numba is not installed. Built on first WeekRanges.intersects call.
+__findMatchKernel = None
+
+
+def _getFindMatchKernel():
+    '''
+        _getFindMatchKernel - Get the compiled kernel which scans arrays of range
+          keys for the first range containing a given week-minute, compiling it on
+          first call.
+
+        @return - The compiled kernel, or False if numba is not installed.
+          The kernel signature is ( weekKey <int>, dayKey <int>, starts, ends,
+          timeOnlys <numpy arrays> ) -> <int> index of the first matching range, or -1.
+    '''
+    global __findMatchKernel
+
+    if __findMatchKernel is None:
+        try:
+            import numba
+        except ImportError:
+            __findMatchKernel = False
+        else:
+            @numba.njit(cache=True)
+            def _findMatchKernel(weekKey, dayKey, starts, ends, timeOnlys):
+                for i in range(len(starts)):
+                    if timeOnlys[i]:
+                        key = dayKey
+                    else:
+                        key = weekKey
+                    if starts[i] <= ends[i]:
+                        if starts[i] <= key and key < ends[i]:
+                            return i
+                    else:
+                        if key >= starts[i] or key < ends[i]:
+                            return i
+                return -1
+
+            __findMatchKernel = _findMatchKernel
+
+    return __findMatchKernel
+
+
+def _parseRangeSideStr(sideStr):
+    '''
+        _parseRangeSideStr - Parse one side of a week range string ( like "Mon 09:00" or "9:00" )
+          using plain string operations.
+
+        @param sideStr <str> - One side of a week range string
+
+        @return tuple( <str/None> dayStr, <str> hourStr, <str> minuteStr )
+
+        @raises ValueError - If #sideStr does not fit the expected shape
+    '''
+    # Split on spaces only, mirroring the regex's [ ]* padding; tabs and
+    #   newlines are not separators and will fail the token checks below
+    parts = [ part for part in sideStr.split(' ') if part ]
+    if len(parts) == 2:
+        dayStr, timeStr = parts
+        if len(dayStr) != 3 or not dayStr.isalpha():
+            raise ValueError('Bad day portion: "%s"' % (dayStr,))
+    elif len(parts) == 1:
+        dayStr = None
+        timeStr = parts[0]
+    else:
+        raise ValueError('Bad range side: "%s"' % (sideStr,))
+
+    # isdecimal + isascii keeps exactly [0-9], matching the ASCII regex and
+    #   guaranteeing int() will accept the token
+    hourStr, minuteStr = timeStr.split(':', 1)
+    if not (1 <= len(hourStr) <= 2 and hourStr.isdecimal() and hourStr.isascii()):
+        raise ValueError('Bad hour portion: "%s"' % (hourStr,))
+    if not (1 <= len(minuteStr) <= 2 and minuteStr.isdecimal() and minuteStr.isascii()):
+        raise ValueError('Bad minute portion: "%s"' % (minuteStr,))
+
+    return (dayStr, hourStr, minuteStr)
+
+
+def _parseRangeStrFast(rangeStr):
+    '''
+        _parseRangeStrFast - Parse a week range string like "Mon 09:00 - Fri 18:00"
+          with plain string operations, avoiding the regex machinery of WEEK_RANGE_RE
+          for the common well-formed case.
+
+        @param rangeStr <str> - The string representation of a week range
+
+        @return tuple( startDayStr, startHourStr, startMinuteStr, endDayStr, endHourStr, endMinuteStr )
+          where the day members may be None. Same members as a WEEK_RANGE_RE group dict.
+
+        @raises ValueError - If #rangeStr does not fit the expected shape
+          ( the caller should then fall back to WEEK_RANGE_RE )
+    '''
+    startStr, endStr = rangeStr.split('-', 1)
+
+    (startDayStr, startHourStr, startMinuteStr) = _parseRangeSideStr(startStr)
+    (endDayStr, endHourStr, endMinuteStr) = _parseRangeSideStr(endStr)
+
+    return (startDayStr, startHourStr, startMinuteStr, endDayStr, endHourStr, endMinuteStr)
+
+
+# _RANGE_INTERN - Intern table of live WeekRange instances keyed by their
+#   normalized values, so identical ranges share one object. Weak values, so
+#   entries vanish once no caller holds the range.
+_RANGE_INTERN = weakref.WeakValueDictionary()
+
+
+@functools.lru_cache(maxsize=256)
+def _createWeekRangeFromStr(cls, rangeStr):
+    '''
+        _createWeekRangeFromStr - Cached worker for WeekRange.createFromStr.
+          WeekRange objects are immutable, so handing the same instance back for a
+          repeated string is safe.
+
+        @param cls <type> - The WeekRange ( sub )class being constructed
+        @param rangeStr <str> - The stripped string representation of the range
+
+        @return <WeekRange> - The created ( possibly cached ) WeekRange
+    '''
+    return cls._createFromStrUncached(rangeStr)
+
+
+class WeekRange(object):
+    '''
+        WeekRange - Represents a range of time relative to a week, like business
+          hours of "Mon 09:00 - Fri 18:00".
+
+        The start is inclusive and the end is exclusive, so a range ending at 18:00
+          does not include 18:00 itself.
+
+        If the start falls after the end ( like "Fri 18:00 - Mon 09:00" ), the range
+          wraps around the week boundary ("outer" range).
+
+        If no days are given ( like "09:00 - 18:00" ), the range applies to every day.
+          A time-only range whose start falls after its end wraps within each day,
+          just like the week-wrapping form above: "18:00 - 09:00" covers the evening
+          through the following morning, and "10:45 - 10:15" covers everything
+          outside [10:15, 10:45). ( Older releases treated the same-hour wrapping
+          form as matching nothing; it now wraps, consistent with every other
+          start-after-end range. )
+
+        WeekRange objects are immutable after construction.
+    '''
+
+    __slots__ = ('startDay', 'startHour', 'startMinute', 'endDay', 'endHour', 'endMinute', '_startKey', '_endKey', '_rangeLen', '_kind', '_str', '_frozen', '__weakref__')
+
+    # _KIND_* - Index into _DISPATCH of the intersect check a range uses
+    _KIND_WEEK = 0
+    _KIND_TIME_ONLY = 1
+
+    def __new__(cls, startDay, startHour, startMinute, endDay, endHour, endMinute):
+        '''
+            __new__ - Return the interned WeekRange for these values when one is
+              already alive, as WeekRange is immutable and identical ranges are
+              common ( e.g. the same hours across several days ). Falls through to
+              normal creation when the values cannot be normalized; __init__ then
+              raises its usual error.
+        '''
+        try:
+            internKey = (cls, \
+                startDay if startDay is None else int(startDay), int(startHour), int(startMinute), \
+                endDay if endDay is None else int(endDay), int(endHour), int(endMinute))
+        except (TypeError, ValueError):
+            internKey = None
+
+        if internKey is not None:
+            existing = _RANGE_INTERN.get(internKey)
+            if existing is not None:
+                return existing
+
+        ret = object.__new__(cls)
+        if internKey is not None:
+            _RANGE_INTERN[internKey] = ret
+        return ret
+
+    def __init__(self, startDay, startHour, startMinute, endDay, endHour, endMinute):
+        '''
+            __init__ - Create a WeekRange
+
+            @param startDay <int/None> - Number of the starting day within the week ( Sunday=0 ),
+              or None for a time-only range which applies every day
+            @param startHour <int> - Starting hour, 0-23
+            @param startMinute <int> - Starting minute, 0-59
+            @param endDay <int/None> - Number of the ending day within the week ( Sunday=0 ),
+              or None for a time-only range
+            @param endHour <int> - Ending hour, 0-23
+            @param endMinute <int> - Ending minute, 0-59
+
+            @raises WeekRangeValueError - If any value is out of range, or if only one
+              of #startDay / #endDay is None
+        '''
+        if getattr(self, '_frozen', False):
+            # An interned instance handed back by __new__, already initialized
+            return
+
+        # Direct slot write so every later assignment is just one slot read in __setattr__
+        object.__setattr__(self, '_frozen', False)
+
+        if (startDay is None) != (endDay is None):
+            raise WeekRangeValueError('Either both or neither of startDay and endDay must be provided.')
+
+        if startDay is not None:
+            startDay = int(startDay)
+            endDay = int(endDay)
+            if not 0 <= startDay <= 6:
+                raise WeekRangeValueError('startDay must be 0-6, got: %s' % (str(startDay),))
+            if not 0 <= endDay <= 6:
+                raise WeekRangeValueError('endDay must be 0-6, got: %s' % (str(endDay),))
+
+        startHour = int(startHour)
+        startMinute = int(startMinute)
+        endHour = int(endHour)
+        endMinute = int(endMinute)
+
+        if not 0 <= startHour <= 23:
+            raise WeekRangeValueError('startHour must be 0-23, got: %s' % (str(startHour),))
+        if not 0 <= endHour <= 23:
+            raise WeekRangeValueError('endHour must be 0-23, got: %s' % (str(endHour),))
+        if not 0 <= startMinute <= 59:
+            raise WeekRangeValueError('startMinute must be 0-59, got: %s' % (str(startMinute),))
+        if not 0 <= endMinute <= 59:
+            raise WeekRangeValueError('endMinute must be 0-59, got: %s' % (str(endMinute),))
+
+        self.startDay = startDay
+        self.startHour = startHour
+        self.startMinute = startMinute
+        self.endDay = endDay
+        self.endHour = endHour
+        self.endMinute = endMinute
+
+        # Encode each endpoint as a single "week-minute" key ( day*1440 + hour*60 + minute,
+        #   or just hour*60 + minute for a time-only range ). _rangeLen is the range's
+        #   length modulo the key space, so the intersect check is the branchless
+        #   wraparound test (key - startKey) % modulus < rangeLen, which covers forward
+        #   and wrapping ranges alike. _kind indexes _DISPATCH to pick the key space.
+        if startDay is None:
+            # Time-only range, applies every day
+            self._startKey = startHour * 60 + startMinute
+            self._endKey = endHour * 60 + endMinute
+            self._rangeLen = (self._endKey - self._startKey) % 1440
+            self._kind = WeekRange._KIND_TIME_ONLY
+        else:
+            self._startKey = startDay * 1440 + startHour * 60 + startMinute
+            self._endKey = endDay * 1440 + endHour * 60 + endMinute
+            self._rangeLen = (self._endKey - self._startKey) % 10080
+            self._kind = WeekRange._KIND_WEEK
+
+        self._str = None
+
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError('WeekRange is immutable.')
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        '''
+            __reduce__ - Rebuild copies and unpickles through the normal constructor,
+              so they go through validation and the intern table instead of raw slot
+              state ( which the immutability guard would reject anyway ).
+        '''
+        return (self.__class__, (self.startDay, self.startHour, self.startMinute, \
+            self.endDay, self.endHour, self.endMinute))
+
+    @classmethod
+    def createFromStr(cls, rangeStr):
+        '''
+            createFromStr - Create a WeekRange from a string representation,
+              like "Mon 09:00 - Fri 18:00", or "09:00 - 18:00" for a range which
+              applies every day.
+
+            Results are cached per input string; since WeekRange is immutable,
+              repeat calls with the same string may return the same instance.
+
+            @param rangeStr <str> - The string representation of the range
+
+            @return <WeekRange> - The created WeekRange
+
+            @raises WeekRangeValueError - If #rangeStr cannot be parsed
+        '''
+        return _createWeekRangeFromStr(cls, rangeStr.strip())
+
+    @classmethod
+    def _createFromStrUncached(cls, rangeStr):
+        '''
+            _createFromStrUncached - Parse #rangeStr and construct a WeekRange.
+              Worker for createFromStr, which caches per input string.
+        '''
+        try:
+            (startDayStr, startHourStr, startMinuteStr, endDayStr, endHourStr, endMinuteStr) = _parseRangeStrFast(rangeStr)
+        except ValueError:
+            # Fast path could not handle the shape ( e.g. spaces around the colon ),
+            #   fall back to the full regex
+            matchObj = WEEK_RANGE_RE.match(rangeStr)
+            if not matchObj:
+                # The fast path's ValueError is just "try the regex", not context
+                raise WeekRangeValueError('Cannot parse week range: "%s"' % (rangeStr,)) from None
+
+            groupDict = matchObj.groupdict()
+            (startDayStr, startHourStr, startMinuteStr, endDayStr, endHourStr, endMinuteStr) = \
+                (groupDict['startDay'], groupDict['startHour'], groupDict['startMinute'], groupDict['endDay'], groupDict['endHour'], groupDict['endMinute'])
+
+        if startDayStr:
+            startDay = dayStrToNumber(startDayStr)
+        else:
+            startDay = None
+        if endDayStr:
+            endDay = dayStrToNumber(endDayStr)
+        elif startDay is not None:
+            # A day on the start but not the end means the same day on both sides
+            endDay = startDay
+        else:
+            endDay = None
+
+        return cls(startDay, int(startHourStr), int(startMinuteStr), endDay, int(endHourStr), int(endMinuteStr))
+
+    def _intersectsWeek(self, datetimeObj):
+        day = datetimeObj.weekday()
+        day = 0 if day == 6 else day + 1
+        key = day * 1440 + datetimeObj.hour * 60 + datetimeObj.minute
+        return (key - self._startKey) % 10080 < self._rangeLen
+
+    def _intersectsTimeOnly(self, datetimeObj):
+        key = datetimeObj.hour * 60 + datetimeObj.minute
+        return (key - self._startKey) % 1440 < self._rangeLen
+
+    def _intersectsKeys(self, weekKey, dayKey):
+        '''
+            _intersectsKeys - Check already-extracted keys against this range, for
+              callers ( like WeekRanges.intersects ) which check one datetime against
+              many ranges and only want to pull the day/hour/minute out once.
+
+            @param weekKey <int> - Minute of the week, Sunday 00:00 = 0
+            @param dayKey <int> - Minute of the day
+
+            @return <bool> - True if the keyed moment falls within this range
+        '''
+        if self._kind == WeekRange._KIND_TIME_ONLY:
+            return (dayKey - self._startKey) % 1440 < self._rangeLen
+        return (weekKey - self._startKey) % 10080 < self._rangeLen
+
+    # _DISPATCH - The intersect check per _kind, indexed by the _KIND_* constants
+    _DISPATCH = (_intersectsWeek, _intersectsTimeOnly)
+
+    def _touchedDays(self):
+        '''
+            _touchedDays - Get the numbers of the week days ( Sunday=0 ) this range
+              covers any minute of. Time-only ranges cover every day; an empty
+              range covers none.
+
+            @return list<int> - Day numbers this range touches
+        '''
+        if self.startDay is None:
+            return list(range(7))
+        if self._rangeLen == 0:
+            return []
+
+        firstDay = self._startKey // 1440
+        # Last minute actually contained ( end is exclusive ), possibly past the
+        #   week boundary for a wrapping range
+        numDays = (self._startKey + self._rangeLen - 1) // 1440 - firstDay + 1
+        if numDays > 7:
+            numDays = 7
+        return [ (firstDay + i) % 7 for i in range(numDays) ]
+
+    def intersects(self, datetimeObj):
+        '''
+            intersects - Check if a given datetime falls within this range
+
+            @param datetimeObj <datetime.datetime> - The datetime to check
+
+            @return <bool> - True if #datetimeObj falls within this range
+        '''
+        return WeekRange._DISPATCH[self._kind](self, datetimeObj)
+
+    def __str__(self):
+        if self._str is not None:
+            return self._str
+
+        if self.startDay is not None:
+            weekDayAbbreviations = _WEEKDAY_ABBREVS
+            ret = f'{weekDayAbbreviations[self.startDay]} {self.startHour:02d}:{self.startMinute:02d} - ' \
+                f'{weekDayAbbreviations[self.endDay]} {self.endHour:02d}:{self.endMinute:02d}'
+        else:
+            ret = f'{self.startHour:02d}:{self.startMinute:02d} - {self.endHour:02d}:{self.endMinute:02d}'
+
+        # Cache on the frozen instance, bypassing the immutability guard
+        object.__setattr__(self, '_str', ret)
+        return ret
+
+    def __repr__(self):
+        return 'WeekRange( %s, %s, %s, %s, %s, %s )' % (str(self.startDay), str(self.startHour), str(self.startMinute), \
+            str(self.endDay), str(self.endHour), str(self.endMinute))
+
+
+class WeekRanges(list):
+    '''
+        WeekRanges - A list of WeekRange objects, with helpers to check a datetime
+          against every contained range, and to parse several comma-separated
+          ranges at once ( like "Mon 09:00 - Fri 18:00, Sat 10:00 - 14:00" ).
+
+        Ranges are indexed by the week days they touch, so checking a datetime only
+          scans the ranges covering its day. append grows the indexes in step; every
+          other mutation marks them dirty, and the next intersects call rebuilds them.
+    '''
+
+    def __init__(self, *args):
+        list.__init__(self, *args)
+        self._indexDirty = True
+
+    def _rebuildIndexes(self):
+        '''
+            _rebuildIndexes - Rebuild the per-weekday buckets and the parallel key
+              arrays from the current contents, clearing the dirty flag
+        '''
+        self._rebuildDayIndex()
+        self._rebuildKeyArrays()
+        self._indexDirty = False
+
+    def _rebuildKeyArrays(self):
+        '''
+            _rebuildKeyArrays - Rebuild ( and cache on self ) parallel typed arrays of
+              every contained range's start key, end key, and time-only flag. The hot
+              scan reads these contiguous arrays instead of chasing a pointer per
+              WeekRange object.
+        '''
+        starts = array.array('H')
+        ends = array.array('H')
+        timeOnlys = bytearray()
+        for weekRange in self:
+            starts.append(weekRange._startKey)
+            ends.append(weekRange._endKey)
+            timeOnlys.append(1 if weekRange.startDay is None else 0)
+        self._starts = starts
+        self._ends = ends
+        self._timeOnly = timeOnlys
+
+    def _rebuildDayIndex(self):
+        '''
+            _rebuildDayIndex - Rebuild ( and cache on self ) the bucket-per-weekday
+              index of contained ranges
+        '''
+        byDay = [ [] for _unused in range(7) ]
+        for weekRange in self:
+            for day in weekRange._touchedDays():
+                byDay[day].append(weekRange)
+        self._byDay = byDay
+
+    def intersects(self, datetimeObj):
+        '''
+            intersects - Check if a given datetime falls within any of the ranges herein
+
+            When numba is installed, the scan runs as a compiled kernel over arrays
+              of the precomputed range keys; otherwise each range is checked in turn.
+
+            @param datetimeObj <datetime.datetime> - The datetime to check
+
+            @return <bool> - True if #datetimeObj falls within any contained range
+        '''
+        # Pull the day/hour/minute out of the datetime once, up front
+        day = datetimeObj.weekday()
+        day = 0 if day == 6 else day + 1
+        dayKey = datetimeObj.hour * 60 + datetimeObj.minute
+        weekKey = day * 1440 + dayKey
+
+        if getattr(self, '_indexDirty', True):
+            self._rebuildIndexes()
+
+        findMatchKernel = _getFindMatchKernel()
+        if findMatchKernel is not False and len(self) > 0:
+            return findMatchKernel(weekKey, dayKey, self._starts, self._ends, self._timeOnly) != -1
+
+        for weekRange in self._byDay[day]:
+            if weekRange._intersectsKeys(weekKey, dayKey):
+                return True
+        return False
+
+    def append(self, weekRange):
+        '''
+            append - Append a WeekRange, maintaining the per-weekday index and the
+              parallel key arrays in step when they are current
+        '''
+        list.append(self, weekRange)
+        if getattr(self, '_indexDirty', True):
+            # Indexes are stale or not yet built; the next intersects call rebuilds
+            #   them ( also covers entries added during unpickling, before __init__ )
+            return
+        for day in weekRange._touchedDays():
+            self._byDay[day].append(weekRange)
+        self._starts.append(weekRange._startKey)
+        self._ends.append(weekRange._endKey)
+        self._timeOnly.append(1 if weekRange.startDay is None else 0)
+
+    def extend(self, weekRanges):
+        '''
+            extend - Append each given WeekRange, maintaining the per-weekday index
+        '''
+        for weekRange in weekRanges:
+            self.append(weekRange)
+
+    # Every other list mutation just marks the indexes dirty; intersects rebuilds
+    #   them on its next call.
+
+    def __setitem__(self, *args):
+        self._indexDirty = True
+        list.__setitem__(self, *args)
+
+    def __delitem__(self, index):
+        self._indexDirty = True
+        list.__delitem__(self, index)
+
+    def __iadd__(self, other):
+        self._indexDirty = True
+        return list.__iadd__(self, other)
+
+    def __imul__(self, count):
+        self._indexDirty = True
+        return list.__imul__(self, count)
+
+    def insert(self, index, weekRange):
+        self._indexDirty = True
+        list.insert(self, index, weekRange)
+
+    def remove(self, weekRange):
+        self._indexDirty = True
+        list.remove(self, weekRange)
+
+    def pop(self, *args):
+        self._indexDirty = True
+        return list.pop(self, *args)
+
+    def sort(self, *args, **kwargs):
+        self._indexDirty = True
+        list.sort(self, *args, **kwargs)
+
+    def reverse(self):
+        self._indexDirty = True
+        list.reverse(self)
+
+    def clear(self):
+        self._indexDirty = True
+        list.clear(self)
+
+    def intersectsBatch(self, timestamps):
+        '''
+            intersectsBatch - Check many timestamps at once against every range herein,
+              vectorized with numpy. Requires numpy to be installed.
+
+            Each timestamp is reduced to its minute within the week with modular
+              arithmetic, then compared against every range's precomputed keys with
+              array operations, instead of a python-level call per timestamp.
+
+            Timestamps are interpreted as-is ( i.e. UTC for POSIX timestamps ); apply
+              any desired timezone offset before calling.
+
+            @param timestamps - A numpy array ( or anything numpy.asarray accepts ) of
+              POSIX timestamps in seconds, or a datetime64 array
+
+            @return <numpy.ndarray> - Boolean array, same shape as #timestamps, True where
+              the timestamp falls within any contained range
+        '''
+        import numpy
+
+        timestamps = numpy.asarray(timestamps)
+        if timestamps.dtype.kind == 'M':
+            minutes = timestamps.astype('datetime64[m]').astype(numpy.int64)
+        else:
+            minutes = timestamps.astype(numpy.int64) // 60
+
+        minuteOfWeek = (minutes + _EPOCH_WEEK_MINUTE_OFFSET) % 10080
+        minuteOfDay = minuteOfWeek % 1440
+
+        ret = numpy.zeros(minuteOfWeek.shape, dtype=bool)
+        for weekRange in self:
+            # Branchless wraparound range test: a key is inside [start, end) modulo
+            #   the week ( or day, for time-only ranges ) exactly when
+            #   (key - start) % modulus < (end - start) % modulus, which covers
+            #   forward and wrapping ranges with one compare per element.
+            if weekRange.startDay is None:
+                key = minuteOfDay
+                modulus = 1440
+            else:
+                key = minuteOfWeek
+                modulus = 10080
+            rangeLen = (weekRange._endKey - weekRange._startKey) % modulus
+            ret |= ((key - weekRange._startKey) % modulus) < rangeLen
+        return ret
+
+    @classmethod
+    def createFromStr(cls, rangesStr):
+        '''
+            createFromStr - Create a WeekRanges from a comma-separated string of
+              week range representations, like "Mon 09:00 - Fri 18:00, Sat 10:00 - 14:00"
+
+            @param rangesStr <str> - Comma-separated week range strings
+
+            @return <WeekRanges> - A WeekRanges containing each parsed range
+
+            @raises WeekRangeValueError - If any portion cannot be parsed
+        '''
+        ret = cls()
+        for rangeStr in rangesStr.split(','):
+            ret.append(WeekRange.createFromStr(rangeStr))
+        return ret
+
+# vim: set ts=4 sw=4 expandtab :